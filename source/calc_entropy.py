@@ -5,10 +5,39 @@ from __future__ import annotations
 import argparse
 import csv
 import math
+import mmap
+import os
 import re
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+# Prefer the AOT build of the thermo kernels (python compile_thermo.py): it is
+# only dlopen'd, so numba is neither imported nor asked to JIT anything.
+try:
+    import _thermo
+except ImportError:
+    _thermo = None
+
+def _no_jit(*args, **kwargs):
+    if len(args) == 1 and callable(args[0]):
+        return args[0]
+    return lambda f: f
+
+if _thermo is not None:
+    njit = _no_jit  # the decorated kernels below are replaced by _thermo's
+else:
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; fall back to plain Python
+        njit = _no_jit
 
 # ---- constants ----
 kB = 1.380649e-23
@@ -25,7 +54,12 @@ Eh_to_Jmol = Eh_J * NA
 
 D_to_au = 0.393430307
 
+_TWO_PI = 2.0 * math.pi
+# I (kg m^2) = _INERTIA_PREFAC / B (cm^-1); the cm^-1 -> m^-1 factor is folded in
+_INERTIA_PREFAC = h / (8.0 * math.pi**2 * c_m * 100.0)
+
 # ---- orientational anharmonic softening (average-curvature HO) ----
+@njit(cache=True, fastmath=True)
 def _langevin(x: float) -> float:
     """Langevin function L(x) = coth(x) - 1/x with numerically stable branches."""
     ax = abs(x)
@@ -36,8 +70,13 @@ def _langevin(x: float) -> float:
     if ax > 50.0:
         # coth(x) ~ 1 for large x
         return 1.0 - 1.0/x
-    return (1.0 / math.tanh(x)) - (1.0 / x)
+    # coth(a) = (1 + e^-2a)/(1 - e^-2a) with m = e^-2a - 1 (expm1 keeps the
+    # small-a digits): one exponential instead of tanh; L is odd in x
+    m = math.expm1(-2.0*ax)
+    L = (2.0 + m)/(-m) - 1.0/ax
+    return L if x > 0.0 else -L
 
+@njit(cache=True, fastmath=True)
 def _keff_from_muE(muE_J: float, T: float) -> float:
     """Return k_eff (J/rad^2) for V(Θ)=muE(1-cosΘ) mapped to 1/2 k_eff Θ^2."""
     if muE_J <= 0.0:
@@ -45,10 +84,57 @@ def _keff_from_muE(muE_J: float, T: float) -> float:
     x = muE_J / (kB * T)
     return muE_J * _langevin(x)
 
-_FLOAT = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[Ee][-+]?\d+)?"
-
-def read_text(p: Path) -> str:
-    return p.read_text(errors="ignore")
+_FLOAT = rb"[-+]?(?:\d+\.?\d*|\.\d+)(?:[Ee][-+]?\d+)?"
+
+# ---- precompiled patterns (built once at import; bytes, for mmap'd outputs) ----
+# Case-sensitive on purpose: anchors use ORCA's exact spelling, so the
+# engine never case-folds while scanning multi-MB outputs.
+_RE_FINAL_E = re.compile(rb"FINAL\s+SINGLE\s+POINT\s+ENERGY.*?(%s)" % _FLOAT)
+_RE_MASS = re.compile(rb"Total\s+Mass.*?(%s)" % _FLOAT)
+_RE_CAV = re.compile(rb"Cavity\s+Volume.*?(%s)" % _FLOAT)
+_RE_ROT = re.compile(rb"Rotational\s+constants\s+in\s+cm-1:.*?(%s)\s+(%s)\s+(%s)" % (_FLOAT, _FLOAT, _FLOAT))
+_RE_DIP = re.compile(
+    rb"Total\s+Dipole\s+Moment.*?(%s)\s+(%s)\s+(%s)" % (_FLOAT, _FLOAT, _FLOAT), re.MULTILINE
+)
+_RE_POLAR_HDR = re.compile(rb"The\s+raw\s+cartesian\s+tensor\s*\((?:atomic\s+units|a\.u\.)\)")
+_RE_VIB = re.compile(rb"Vibrational\s+entropy.*?(%s)\s*kcal/mol" % _FLOAT)
+
+# parse_* functions take raw ORCA output: bytes or a read-only mmap of the file
+Buffer = Union[bytes, mmap.mmap]
+
+_MADV_WILLNEED = getattr(mmap, "MADV_WILLNEED", None)  # POSIX only
+
+def read_mmap(p: Path) -> mmap.mmap:
+    """Map an output file read-only; the caller closes it (mmap is a context manager)."""
+    with p.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if _MADV_WILLNEED is not None:
+        # start kernel readahead now instead of faulting pages in during the scan
+        mm.madvise(_MADV_WILLNEED)
+    return mm
+
+# conformer directories are named 001-*, 002-*, ...
+_RE_CONF_DIR = re.compile(r"[0-9]{3}-")
+
+# below this many conformers main runs serially instead of starting a process pool
+_PARALLEL_MIN_CONFS = 16
+
+# outputs read by the per-conformer worker (the gas energy is read up front)
+_WORKER_FILES = (
+    "scale_1.0/orca.out",
+    "scale_1.2/orca.out",
+    "scale_1.2/polar/orca.out",
+    "gas/polar/orca.out",
+)
+
+# ORCA outputs required for each conformer directory
+_OUT_FILES = (
+    "gas/orca.out",
+    "gas/polar/orca.out",
+    "scale_1.0/orca.out",
+    "scale_1.2/orca.out",
+    "scale_1.2/polar/orca.out",
+)
 
 def find_out(base: Path, rel: str) -> Path:
     p = base / rel
@@ -57,92 +143,78 @@ def find_out(base: Path, rel: str) -> Path:
     p2 = base / (rel + ".out")
     if p2.exists():
         return p2
-    d = (base / rel).parent
-    if d.exists():
-        outs = sorted(d.glob("*.out"))
-        if outs:
-            return outs[0]
-    raise FileNotFoundError(f"Missing file: {base / rel}")
-
-def dot3(a, b) -> float:
-    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
-
-def matvec3(M, v):
-    return (
-        M[0][0]*v[0] + M[0][1]*v[1] + M[0][2]*v[2],
-        M[1][0]*v[0] + M[1][1]*v[1] + M[1][2]*v[2],
-        M[2][0]*v[0] + M[2][1]*v[1] + M[2][2]*v[2],
-    )
-
-def norm3(v) -> float:
-    return math.sqrt(dot3(v, v))
+    # glob of a missing directory is simply empty; no separate exists() stat
+    outs = sorted(p.parent.glob("*.out"))
+    if outs:
+        return outs[0]
+    raise FileNotFoundError(f"Missing file: {p}")
 
 # ---- Robust Parsing Functions ----
 
-def parse_final_energy_Eh(t: str) -> float:
-    m = re.search(r"FINAL\s+SINGLE\s+POINT\s+ENERGY.*?(%s)" % _FLOAT, t, re.IGNORECASE)
+def _polar_rows_after(t: Buffer, pos: int) -> np.ndarray:
+    # the three tensor rows are the first non-blank lines after the header line;
+    # slice exactly to the end of the third so no number is cut off
+    rows = []
+    start = t.find(b"\n", pos) + 1
+    while start and len(rows) < 3:
+        end = t.find(b"\n", start)
+        line = t[start:] if end < 0 else t[start:end]
+        if line.strip():
+            rows.append(line)
+        start = end + 1
+    if len(rows) < 3:
+        raise ValueError("Could not find 3 rows of polarizability tensor.")
+    with warnings.catch_warnings():
+        # fromstring only warns when it meets non-numeric text; make that an error
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            alpha = np.fromstring(b" ".join(rows), sep=" ")
+        except (DeprecationWarning, ValueError):
+            alpha = np.empty(0)
+    if alpha.size != 9:
+        raise ValueError("Could not find 3 rows of polarizability tensor.")
+    return alpha.reshape(3, 3)
+
+def parse_final_energy_Eh(t: Buffer) -> float:
+    m = _RE_FINAL_E.search(t)
     if not m:
         raise ValueError("FINAL SINGLE POINT ENERGY not found.")
     return float(m.group(1))
 
-def parse_mol_weight_amu(t: str) -> float:
-    m = re.search(r"Total\s+Mass.*?(%s)" % _FLOAT, t, re.IGNORECASE)
+def parse_mol_weight_amu(t: Buffer) -> float:
+    m = _RE_MASS.search(t)
     if m:
         return float(m.group(1))
     raise ValueError("Total Mass was not found.")
 
-def parse_cavity_volume_bohr3(text: str) -> float:
-    m = re.search(r"Cavity\s+Volume.*?(%s)" % _FLOAT, text, re.IGNORECASE)
+def parse_cavity_volume_bohr3(text: Buffer) -> float:
+    m = _RE_CAV.search(text)
     if not m:
         raise ValueError("Cavity Volume line not found.")
     return float(m.group(1))
 
-def parse_rot_constants_cm(t: str) -> Tuple[float, float, float]:
+def parse_rot_constants_cm(t: Buffer) -> Tuple[float, float, float]:
     # "Rotational constants in cm-1: ... 0.1 0.2 0.3"
-    m = re.search(
-        r"Rotational\s+constants\s+in\s+cm-1:.*?(%s)\s+(%s)\s+(%s)" % (_FLOAT, _FLOAT, _FLOAT),
-        t, re.IGNORECASE
-    )
+    m = _RE_ROT.search(t)
     if m:
         return (float(m.group(1)), float(m.group(2)), float(m.group(3)))
     raise ValueError("Rotational constants not found.")
 
-def parse_dipole_vec_au(t: str) -> Tuple[float, float, float]:
+def parse_dipole_vec_au(t: Buffer) -> Tuple[float, float, float]:
     # "Total Dipole Moment : ... 0.1 0.2 0.3"
-    m = re.search(
-        r"Total\s+Dipole\s+Moment.*?(%s)\s+(%s)\s+(%s)" % (_FLOAT, _FLOAT, _FLOAT),
-        t,
-        re.IGNORECASE | re.MULTILINE,
-    )
+    m = _RE_DIP.search(t)
     if not m:
         raise ValueError("Total Dipole Moment vector (a.u.) not found.")
     return (float(m.group(1)), float(m.group(2)), float(m.group(3)))
 
-def parse_polar_tensor_au(t: str) -> Tuple[Tuple[float, float, float],
-                                           Tuple[float, float, float],
-                                           Tuple[float, float, float]]:
-    header_pattern = r"The\s+raw\s+cartesian\s+tensor\s*\((?:atomic\s+units|a\.u\.)\)"
-    block_match = re.search(header_pattern, t, re.IGNORECASE)
+def parse_polar_tensor_au(t: Buffer) -> np.ndarray:
+    block_match = _RE_POLAR_HDR.search(t)
     if not block_match:
         raise ValueError("Polarizability tensor not found.")
+    return _polar_rows_after(t, block_match.end())
 
-    remaining_text = t[block_match.end():]
-    line_pattern = r"(%s)\s+(%s)\s+(%s)" % (_FLOAT, _FLOAT, _FLOAT)
-    matches = re.findall(line_pattern, remaining_text)
-    
-    if len(matches) < 3:
-        raise ValueError("Could not find 3 rows of polarizability tensor.")
-
-    row1 = (float(matches[0][0]), float(matches[0][1]), float(matches[0][2]))
-    row2 = (float(matches[1][0]), float(matches[1][1]), float(matches[1][2]))
-    row3 = (float(matches[2][0]), float(matches[2][1]), float(matches[2][2]))
-    return (row1, row2, row3)
-
-def parse_vib_entropy_JmolK(t: str, T: float) -> float:
-    m = re.search(
-        r"Vibrational\s+entropy.*?(%s)\s*kcal/mol" % _FLOAT,
-        t, re.IGNORECASE
-    )
+def parse_vib_entropy_JmolK(t: Buffer, T: float) -> float:
+    m = _RE_VIB.search(t)
     if m:
         ts_kcalmol = float(m.group(1))
         return (ts_kcalmol * 4184.0) / T
@@ -150,16 +222,17 @@ def parse_vib_entropy_JmolK(t: str, T: float) -> float:
     raise ValueError("Vibrational entropy not found.")
 
 # ---- thermo model ----
+@njit(cache=True, fastmath=True)
 def ho_entropy(nu_cm: float, T: float) -> float:
     """Quantum HO entropy per mode (J/mol/K) from wavenumber (cm^-1)."""
     if nu_cm <= 0.0:
         return 0.0
     x = (h * c_cm * nu_cm) / (kB * T)
-    try:
-        ex = math.exp(x)
-        return R * (x / (ex - 1.0) - math.log(1.0 - math.exp(-x)))
-    except OverflowError:
+    if x > 700.0:
+        # exp(x) would overflow; the mode is frozen out
         return 0.0
+    ex = math.exp(x)
+    return R * (x / (ex - 1.0) - math.log(1.0 - math.exp(-x)))
 
 # Quasi-Translational frequencies
 def vfree_bohr3(V12: float, V10: float) -> float:
@@ -174,23 +247,28 @@ def nu_trans_cm(Vfree: float, mw_amu: float, T: float) -> float:
     nu_hz = omega / (2.0 * math.pi)
     return nu_hz / c_cm
 
+# (3/(4 pi))^(1/3) * bohr_m: radius prefactor of a sphere of volume V (bohr^3) in m
+_L_PREFAC = (3.0 / (4.0 * math.pi))**(1.0/3.0) * bohr_m
+
+def nu_trans_cm_from_volumes(V10: float, V12: float, mw_amu: float, T: float) -> float:
+    """nu_trans_cm(vfree_bohr3(V12, V10), ...) with the cube/cube-root pair cancelled."""
+    L_m = _L_PREFAC * (V12**(1.0/3.0) - V10**(1.0/3.0))
+    if L_m <= 0.0:
+        return 0.0
+    m_kg = mw_amu * amu_kg
+    omega = math.sqrt(_TWO_PI * kB * T / m_kg) / L_m
+    return omega / _TWO_PI / c_cm
+
 # Quasi-Rotational frequencies
 def nu_rot_cm(rot_cm, mu_liq_au, mu_gas_au, alpha_au, T: float, *, nu_floor_cm: float = 0.0, use_avg_curv: bool = True):
-    A_cm, B_cm, C_cm = rot_cm
-    mu_star = (mu_liq_au[0]-mu_gas_au[0], 
-               mu_liq_au[1]-mu_gas_au[1], 
-               mu_liq_au[2]-mu_gas_au[2]
-               )
-    mu_star_norm = norm3(mu_star)
+    mu_star = np.subtract(mu_liq_au, mu_gas_au, dtype=np.float64)
+    mu_star_norm = float(np.linalg.norm(mu_star))
     if mu_star_norm == 0.0:
         return (0.0, 0.0, 0.0)
 
-    u = (mu_star[0]/mu_star_norm, 
-         mu_star[1]/mu_star_norm, 
-         mu_star[2]/mu_star_norm)
-
-    au = matvec3(alpha_au, u)
-    P = dot3(u, au)  # u^T alpha u
+    u = mu_star / mu_star_norm
+    A = np.asarray(alpha_au, dtype=np.float64)
+    P = float(u @ A @ u)  # u^T alpha u
     if P <= 0.0:
         # fallback if Polarizability is weird
         return (0.0, 0.0, 0.0)
@@ -201,39 +279,33 @@ def nu_rot_cm(rot_cm, mu_liq_au, mu_gas_au, alpha_au, T: float, *, nu_floor_cm:
 
     k_eff_J = _keff_from_muE(muE_J, T) if use_avg_curv else muE_J
 
-    def inertia_from_Bcm(Bcm: float) -> float:
-        if Bcm == 0.0: return 1e99
-        B_m = Bcm * 100.0
-        return h / (8.0 * math.pi**2 * c_m * B_m)
+    # principal moments of inertia from A, B, C (cm^-1); B = 0 gives I = inf, nu = 0
+    with np.errstate(divide="ignore"):
+        I = _INERTIA_PREFAC / np.asarray(rot_cm, dtype=np.float64)
+    nu_cm = np.sqrt(k_eff_J / I) / _TWO_PI / c_cm
+    nu_cm = np.where(nu_cm < nu_floor_cm, nu_floor_cm, nu_cm)
 
-    def wavenumber_from_I(I: float) -> float:
-        if I == 0.0: return 0.0
-        nu_hz = (1.0 / (2.0 * math.pi)) * math.sqrt(k_eff_J / I)
-        nu_cm = nu_hz / c_cm
-        if nu_floor_cm > 0.0 and nu_cm < nu_floor_cm:
-            return nu_floor_cm
-        return nu_cm
+    return tuple(float(x) for x in nu_cm)
 
-    Ia = inertia_from_Bcm(A_cm)
-    Ib = inertia_from_Bcm(B_cm)
-    Ic = inertia_from_Bcm(C_cm)
 
-    return (wavenumber_from_I(Ia), wavenumber_from_I(Ib), wavenumber_from_I(Ic))
+@njit(cache=True, fastmath=True)
+def _s_isomer_kernel(E_Eh: np.ndarray, T: float) -> float:
+    RT = R * T
+    dE = (E_Eh - E_Eh.min()) * Eh_to_Jmol
+    # log-sum-exp: ln q = ymax + ln sum exp(y - ymax), weights w = exp(y - ln q)
+    y = -dE / RT
+    ymax = y.max()
+    logq = ymax + math.log(np.exp(y - ymax).sum())
+    w = np.exp(y - logq)
+    avg = (dE * w).sum()
+    return R * (logq + avg / RT)
 
+if _thermo is not None:
+    from _thermo import _keff_from_muE, _langevin, _s_isomer_kernel, ho_entropy
 
 def S_isomer_JmolK(E_Eh: Dict[str, float], T: float) -> float:
     if not E_Eh: return 0.0
-    Emin = min(E_Eh.values())
-    q = 0.0
-    num = 0.0
-    for Ei in E_Eh.values():
-        dE = (Ei - Emin) * Eh_to_Jmol
-        w = math.exp(-dE / (R * T))
-        q += w
-        num += dE * w
-    if q == 0: return 0.0
-    avg = num / q
-    return R * (math.log(q) + avg / (R * T))
+    return _s_isomer_kernel(np.fromiter(E_Eh.values(), dtype=np.float64, count=len(E_Eh)), T)
 
 
 # ---- main ----
@@ -247,93 +319,120 @@ class Row:
     S_total: float
 
 
-def main(root: Path, T: float, nu_floor_rot: float = 0.0, use_avg_curv: bool = True) -> None:
+def _process_conformer(d: Path, paths: Dict[str, Path], *, T: float, S_isomer: float,
+                       nu_floor_rot: float, use_avg_curv: bool, io_threads: bool = False) -> Optional[Row]:
+    """Compute the entropy row of one conformer directory (serially or in a pool worker)."""
+    try:
+        with ExitStack() as stack:
+            if io_threads:
+                # overlap open()/readahead of the four outputs on high-latency filesystems
+                with ThreadPoolExecutor(max_workers=4) as io:
+                    futs = [io.submit(read_mmap, paths[rel]) for rel in _WORKER_FILES]
+                # register every map that did open before a failed one re-raises below
+                for fut in futs:
+                    if fut.exception() is None:
+                        stack.enter_context(fut.result())
+                t10, t12, t12p, tgp = (fut.result() for fut in futs)
+            else:
+                t10, t12, t12p, tgp = (stack.enter_context(read_mmap(paths[rel])) for rel in _WORKER_FILES)
+            V10 = parse_cavity_volume_bohr3(t10)
+            V12 = parse_cavity_volume_bohr3(t12)
+            mw = parse_mol_weight_amu(t12)
+            rot = parse_rot_constants_cm(t12)
+            Svib = parse_vib_entropy_JmolK(t12, T)
+            mu_liq = parse_dipole_vec_au(t12p)
+            mu_gas = parse_dipole_vec_au(tgp)
+            alpha = parse_polar_tensor_au(tgp)
+
+        nu_tr = nu_trans_cm_from_volumes(V10, V12, mw, T)
+        Strans = 3.0 * ho_entropy(nu_tr, T)
+
+        nua, nub, nuc = nu_rot_cm(rot, mu_liq, mu_gas, alpha, T, nu_floor_cm=nu_floor_rot, use_avg_curv=use_avg_curv)
+        Srot = ho_entropy(nua, T) + ho_entropy(nub, T) + ho_entropy(nuc, T)
+        Stot = Strans + Srot + Svib + S_isomer
+        return Row(d.name, Strans, Srot, Svib, S_isomer, Stot)
+
+    except Exception as e:
+        # stderr keeps the streamed CSV echo on stdout a clean block
+        print(f"Error processing {d.name}: {e}", file=sys.stderr, flush=True)
+        return None
+
+
+def main(root: Path, T: float, nu_floor_rot: float = 0.0, use_avg_curv: bool = True,
+         io_threads: bool = False) -> None:
     if (root / "gas/orca.out").exists() or (root / "gas").exists():
         all_dirs = [root]
     else:
-        all_dirs = sorted([p for p in root.glob("[0-9][0-9][0-9]-*") if p.is_dir()])
+        # DirEntry.is_dir() uses the type from readdir, so no stat per entry
+        try:
+            with os.scandir(root) as it:
+                all_dirs = sorted((Path(e.path) for e in it if _RE_CONF_DIR.match(e.name) and e.is_dir()),
+                                  key=lambda p: p.name)
+        except (FileNotFoundError, NotADirectoryError):
+            # missing root or a plain file: report "No directories found" like the glob did
+            all_dirs = []
     
     if not all_dirs:
         print(f"No directories found in {root}")
         return
 
-    confs = []
     print(f"Scanning {len(all_dirs)} directories...")
-    
+
+    # Resolve each output once and read the gas energy in the same pass;
+    # S_isomer uses gas energies across all VALID (complete) conformers.
+    resolved: Dict[Path, Dict[str, Path]] = {}
+    E: Dict[str, float] = {}
     for d in all_dirs:
         try:
-            find_out(d, "gas/orca.out")
-            find_out(d, "gas/polar/orca.out")
-            find_out(d, "scale_1.0/orca.out")
-            find_out(d, "scale_1.2/orca.out")
-            find_out(d, "scale_1.2/polar/orca.out")
-            confs.append(d)
+            paths = {rel: find_out(d, rel) for rel in _OUT_FILES}
         except FileNotFoundError:
             continue
+        resolved[d] = paths
+        try:
+            with read_mmap(paths["gas/orca.out"]) as g:
+                E[d.name] = parse_final_energy_Eh(g)
+        except Exception as e:
+            print(f"Warning: Failed to read Energy for {d.name}: {e}")
 
+    confs = list(resolved)
     if not confs:
         print("No valid complete directories found (missing files).")
         return
 
-    # S_isomer from gas energies across all VALID conformers
-    E: Dict[str, float] = {}
-    for d in confs:
-        try:
-            g = read_text(find_out(d, "gas/orca.out"))
-            E[d.name] = parse_final_energy_Eh(g)
-        except Exception as e:
-            print(f"Warning: Failed to read Energy for {d.name}: {e}")
-
     Siso = S_isomer_JmolK(E, T)
 
-    rows: List[Row] = []
-    for d in confs:
-        try:
-            t10  = read_text(find_out(d, "scale_1.0/orca.out"))
-            t12  = read_text(find_out(d, "scale_1.2/orca.out"))
-            t12p = read_text(find_out(d, "scale_1.2/polar/orca.out"))
-            tgp  = read_text(find_out(d, "gas/polar/orca.out"))
-
-            V10 = parse_cavity_volume_bohr3(t10)
-            V12 = parse_cavity_volume_bohr3(t12)
-            Vfree = vfree_bohr3(V12, V10)
-
-            mw = parse_mol_weight_amu(t12)
-            nu_tr = nu_trans_cm(Vfree, mw, T)
-            Strans = 3.0 * ho_entropy(nu_tr, T)
-
-            rot = parse_rot_constants_cm(t12)
-            mu_liq = parse_dipole_vec_au(t12p)
-            mu_gas = parse_dipole_vec_au(tgp)
-            alpha = parse_polar_tensor_au(tgp)
-            nua, nub, nuc = nu_rot_cm(rot, mu_liq, mu_gas, alpha, T, nu_floor_cm=nu_floor_rot, use_avg_curv=use_avg_curv)
-            Srot = ho_entropy(nua, T) + ho_entropy(nub, T) + ho_entropy(nuc, T)
-            Svib = parse_vib_entropy_JmolK(t12, T)
-            Stot = Strans + Srot + Svib + Siso
-            rows.append(Row(d.name, Strans, Srot, Svib, Siso, Stot))
-            
-        except Exception as e:
-            print(f"Error processing {d.name}: {e}")
-            continue
-
     out = root / "entropy_summary.csv"
     try:
-        with out.open("w", newline="") as f:
-            w = csv.writer(f)
-            w.writerow(["conformer", "S_trans(J/mol/K)", "S_rot(J/mol/K)", "S_vib(J/mol/K)",
-                        "S_isomer(J/mol/K)", "S_total(J/mol/K)"])
-            for r in rows:
-                w.writerow([r.name, f"{r.S_trans:.6f}", f"{r.S_rot:.6f}", f"{r.S_vib:.6f}",
-                            f"{r.S_isomer:.6f}", f"{r.S_total:.6f}"])
-        print(f"Successfully wrote results to: {out.resolve()}")
-        
-        print(f"T = {T:.2f} K, S_isomer = {Siso:.6f} J/mol/K")
-        print("conformer,S_trans,S_rot,S_vib,S_isomer,S_total")
-        for r in rows:
-            print(f"{r.name},{r.S_trans:.6f},{r.S_rot:.6f},{r.S_vib:.6f},{r.S_isomer:.6f},{r.S_total:.6f}")
-            
+        f = out.open("w", newline="")
     except PermissionError:
         print(f"Error: Could not write to {out}. Check permissions.")
+        return
+
+    print(f"T = {T:.2f} K, S_isomer = {Siso:.6f} J/mol/K")
+    print("conformer,S_trans,S_rot,S_vib,S_isomer,S_total")
+
+    # rows are written and echoed as they are produced (in input order)
+    work = partial(_process_conformer, T=T, S_isomer=Siso, nu_floor_rot=nu_floor_rot,
+                   use_avg_curv=use_avg_curv, io_threads=io_threads)
+    paths = [resolved[d] for d in confs]
+    n_workers = min(os.cpu_count() or 1, len(confs))
+    with f, ExitStack() as stack:
+        if len(confs) < _PARALLEL_MIN_CONFS or n_workers < 2:
+            # pool start-up (and per-worker imports) outweighs the work itself
+            results = map(work, confs, paths)
+        else:
+            ex = stack.enter_context(ProcessPoolExecutor(max_workers=n_workers))
+            results = ex.map(work, confs, paths, chunksize=max(1, len(confs) // (4 * n_workers)))
+        w = csv.writer(f)
+        w.writerow(["conformer", "S_trans(J/mol/K)", "S_rot(J/mol/K)", "S_vib(J/mol/K)",
+                    "S_isomer(J/mol/K)", "S_total(J/mol/K)"])
+        for r in results:
+            if r is None:
+                continue
+            w.writerow([r.name, f"{r.S_trans:.6f}", f"{r.S_rot:.6f}", f"{r.S_vib:.6f}",
+                        f"{r.S_isomer:.6f}", f"{r.S_total:.6f}"])
+            print(f"{r.name},{r.S_trans:.6f},{r.S_rot:.6f},{r.S_vib:.6f},{r.S_isomer:.6f},{r.S_total:.6f}")
+    print(f"Successfully wrote results to: {out.resolve()}")
 
 
 if __name__ == "__main__":
@@ -344,6 +443,9 @@ if __name__ == "__main__":
                     help="Minimum librational wavenumber (cm^-1) for rotational HO modes (0 disables).")
     ap.add_argument("--no-avg-curv", action="store_true",
                     help="Disable average-curvature softening; use plain HO k=muE.")
+    ap.add_argument("--io-threads", action="store_true",
+                    help="Open each conformer's outputs from 4 threads (helps only on high-latency/network filesystems).")
     a = ap.parse_args()
-    main(Path(a.root).resolve(), float(a.T), nu_floor_rot=float(a.nu_floor_rot), use_avg_curv=(not a.no_avg_curv))
+    main(Path(a.root).resolve(), float(a.T), nu_floor_rot=float(a.nu_floor_rot), use_avg_curv=(not a.no_avg_curv),
+         io_threads=a.io_threads)
 
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Build _thermo, an ahead-of-time compiled copy of the thermo kernels in calc_entropy.py.
+
+Run once after installing numba (a C compiler is required):
+
+    python compile_thermo.py
+
+The extension is written next to calc_entropy.py, which imports it when present
+and otherwise falls back to the njit (or plain Python) definitions.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from numba.pycc import CC
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+# compile from the njit sources, never from a previously built _thermo
+sys.modules["_thermo"] = None
+
+import calc_entropy as ce  # noqa: E402
+
+cc = CC("_thermo")
+cc.output_dir = str(HERE)
+
+# fixed float64 signatures, matching how calc_entropy calls the kernels
+cc.export("_langevin", "f8(f8)")(ce._langevin.py_func)
+cc.export("_keff_from_muE", "f8(f8, f8)")(ce._keff_from_muE.py_func)
+cc.export("ho_entropy", "f8(f8, f8)")(ce.ho_entropy.py_func)
+cc.export("_s_isomer_kernel", "f8(f8[:], f8)")(ce._s_isomer_kernel.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built _thermo in {HERE}")